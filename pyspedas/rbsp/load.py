@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pyspedas.utilities.dailynames import dailynames
 from pyspedas.utilities.download import download
 from pyspedas.analysis.time_clip import time_clip as tclip
@@ -39,6 +40,7 @@ def load(trange=['2018-11-5', '2018-11-6'],
         probe = [probe]
 
     out_files = []
+    remote_names = []
 
     for prb in probe:
         if instrument == 'emfisis':
@@ -64,12 +66,17 @@ def load(trange=['2018-11-5', '2018-11-6'],
 
 
         # find the full remote path names using the trange
-        remote_names = dailynames(file_format=pathformat, trange=trange)
+        remote_names.append(dailynames(file_format=pathformat, trange=trange))
 
-        files = download(remote_file=remote_names, remote_path=CONFIG['remote_data_dir'], local_path=CONFIG['local_data_dir'], no_download=no_update)
-        if files is not None:
-            for file in files:
-                out_files.append(file)
+    # download each probe's files in its own thread, so the network requests overlap;
+    # each call gets its own headers dict, since download() modifies it in place
+    with ThreadPoolExecutor(max_workers=len(probe)) as executor:
+        results = executor.map(lambda names: download(remote_file=names, remote_path=CONFIG['remote_data_dir'], local_path=CONFIG['local_data_dir'], headers={}, no_download=no_update), remote_names)
+
+        for files in results:
+            if files is not None:
+                for file in files:
+                    out_files.append(file)
 
     out_files = sorted(out_files)
 
@@ -140,7 +140,6 @@ class CotransTestCases(unittest.TestCase):
         in_len = len(t)
         name1 = "name1"
         name2 = "name2"
-        count = 0
         # Test non-existent system.
         cotrans(name_out=name1, time_in=t, data_in=d,
                 coord_in="coord_in", coord_out="coord_out")
@@ -151,7 +150,6 @@ class CotransTestCases(unittest.TestCase):
         # Test all combinations.
         for coord_in in all_cotrans:
             for coord_out in all_cotrans:
-                count += 1
                 del_data()
                 cotrans(name_out=name1, time_in=t, data_in=d,
                         coord_in=coord_in, coord_out=coord_out)
@@ -164,9 +162,6 @@ class CotransTestCases(unittest.TestCase):
                 dout2 = get_data(name2)
                 out_len2 = len(dout2[0])
                 dd2 = dout2[1][1]
-                print(count, "--- in:", coord_in, "out:", coord_out)
-                # print(dout[1][1])
-                # print(dd2)
                 self.assertTrue(out_len2 == in_len)
                 self.assertTrue(abs(dd1[0]-dd2[0]) <= 1e-6)
                 self.assertTrue(abs(dd1[1]-dd2[1]) <= 1e-6)
@@ -1,5 +1,6 @@
 """Test fuctions in the utilites folder."""
 import unittest
+from datetime import datetime
 
 from pyspedas.utilities.dailynames import dailynames
 from pyspedas import tcopy
@@ -45,7 +46,10 @@ class UtilTestCases(unittest.TestCase):
         t1 = time_datetime(None)
         t2 = time_datetime(1000000000.0)
         t3 = time_string_one(None)
-        print("Time_string functions test:", t0, t1, t2, t3)
+        self.assertTrue(isinstance(t0, str))
+        self.assertTrue(isinstance(t1, datetime))
+        self.assertTrue(isinstance(t2, datetime))
+        self.assertTrue(isinstance(t3, str))
         self.assertTrue(time_string(1450181243.767) ==
                         '2015-12-15 12:07:23.767000')
         self.assertTrue(time_string([1450181243.767, 1450181263.767])
@@ -57,7 +61,9 @@ class UtilTestCases(unittest.TestCase):
         t0 = time_float()
         t1 = time_float_one()
         t2 = time_float(1450181243)
-        print("Time_double functions test:", t0, t1, t2)
+        self.assertTrue(isinstance(t0, float))
+        self.assertTrue(isinstance(t1, float))
+        self.assertTrue(t2 == 1450181243.0)
         self.assertTrue(time_double('2015-12-15 12:07:23.767000')
                         == 1450181243.767)
         self.assertTrue(time_double(['2015-12-15 12:07:23.767000',